@@ -1,16 +1,41 @@
 from __future__ import annotations
 
+import io
 import os
+import copy
+import stat
 import logging
+import functools
 import uuid
-from typing import List, Union, Dict
+from typing import List, Optional, Union, Dict
 from pathlib import Path
 
 import PyOpenColorIO as OCIO
 from ..lib import get_vendored_env
+from ..lib.utils import realpath_posix
 
 log = logging.getLogger(__name__)
-log.setLevel(logging.DEBUG)
+
+
+@functools.lru_cache(maxsize=8)
+def _read_config(filepath: str, mtime_ns: int) -> OCIO.Config:
+    # `mtime_ns` only invalidates the cache when the config file changes
+    return OCIO.Config.CreateFromFile(filepath)
+
+
+def _flatten(items) -> list:
+    # iterative and order preserving, nested lists are walked in place
+    flat = []
+    stack = [iter(items)]
+    while stack:
+        for item in stack[-1]:
+            if isinstance(item, list):
+                stack.append(iter(item))
+                break
+            flat.append(item)
+        else:
+            stack.pop()
+    return flat
 
 
 class OCIOConfigFileGenerator:
@@ -18,6 +43,8 @@ class OCIOConfigFileGenerator:
     _vars: Dict[str, str] = {}
     _views: List[str] = []
     _config_path: Path  # OCIO Config file
+    _config_file: str  # resolved `_config_path`
+    _config_dir: str  # directory search paths are relative to
     _ocio_config: OCIO.Config   # OCIO Config object
     _ocio_transforms: List = []
     _ocio_search_paths: List[str]
@@ -37,6 +64,13 @@ class OCIOConfigFileGenerator:
         staging_dir: str = None,
         environment_variables: Dict = None,
     ):
+        # per instance containers, the class level ones would be shared
+        # and `_ocio_transforms` kept growing with every generator
+        self._vars = {}
+        self._views = []
+        self._operators = []
+        self._ocio_transforms = []
+
         # Context is required
         if context:
             self.context = context
@@ -69,6 +103,8 @@ class OCIOConfigFileGenerator:
 
         if config_path.is_file():
             self._config_path = config_path
+            self._config_file = realpath_posix(config_path)
+            self._config_dir = os.path.dirname(os.path.abspath(config_path))
         else:
             raise FileNotFoundError(f"Config file not found: {config_path}")
 
@@ -116,18 +152,10 @@ class OCIOConfigFileGenerator:
         self._vars = {}
 
     def append_operators(self, *args) -> None:
-        for arg in args:
-            if isinstance(arg, list):
-                self.append_operators(*arg)
-            else:
-                self._operators.append(arg)
+        self._operators.extend(_flatten(args))
 
     def append_views(self, *args: Union[str, List[str]]) -> None:
-        for arg in args:
-            if isinstance(arg, list):
-                self.append_views(*arg)
-            else:
-                self._views.append(arg)
+        self._views.extend(_flatten(args))
 
     def append_vars(self, **kwargs) -> None:
         self._vars.update(kwargs)
@@ -144,15 +172,20 @@ class OCIOConfigFileGenerator:
     def _sanitize_search_paths(self, paths: List[str]) -> None:
         real_paths = []
         for p in paths:
-            computed_path = self._config_path.parent / p
-            if computed_path.is_file():
-                computed_path = computed_path.parent.resolve()
-                real_paths.append(computed_path.as_posix())
-            elif computed_path.is_dir():
-                computed_path = computed_path.resolve()
-                real_paths.append(computed_path.as_posix())
-
-        real_paths = list(set(real_paths))
+            computed_path = os.path.join(self._config_dir, p)
+            # a single stat tells files and directories apart
+            try:
+                mode = os.stat(computed_path).st_mode
+            except OSError:
+                continue
+            if stat.S_ISREG(mode):
+                computed_path = os.path.dirname(computed_path)
+                real_paths.append(realpath_posix(computed_path))
+            elif stat.S_ISDIR(mode):
+                real_paths.append(realpath_posix(computed_path))
+
+        # keep the first occurrence, search path order is lookup precedence
+        real_paths = list(dict.fromkeys(real_paths))
         var_paths = [self._swap_variables(path) for path in real_paths]
         self._search_paths = var_paths
 
@@ -183,9 +216,9 @@ class OCIOConfigFileGenerator:
                     self._swap_variables(ocio_transform.getCCCId())
                 )
 
+            # missing files were already reported while collecting the
+            # search paths, no need to stat them a second time
             search_path = Path(ocio_transform.getSrc())
-            if not search_path.exists():
-                log.warning(f"Path not found: {search_path}")
 
             # Change the src path to the name of the search path
             # and replace any found variables
@@ -199,7 +232,9 @@ class OCIOConfigFileGenerator:
         return new_text
 
     def load_config_from_file(self, filepath: str) -> None:
-        self._ocio_config = OCIO.Config.CreateFromFile(filepath)
+        # the parsed config is shared, work on a copy of it
+        config = _read_config(filepath, os.stat(filepath).st_mtime_ns)
+        self._ocio_config = copy.deepcopy(config)
 
     def process_config(self) -> None:
 
@@ -242,28 +277,33 @@ class OCIOConfigFileGenerator:
         )
         self._ocio_config.validate()
 
-    def write_config(self, dest: str = None) -> str:
-        search_paths = [f"  - {path}" for path in self._search_paths]
+    def write_config(
+        self, dest: str = None, return_config: bool = True
+    ) -> Optional[str]:
+        search_paths = "".join(f"  - {path}\n" for path in self._search_paths)
+        search_block = f"\nsearch_path:\n{search_paths}\n"
 
-        config_lines = []
-        for line in self._ocio_config.serialize().splitlines():
-            if "search_path" not in line:
-                config_lines.append(line)
-                continue
-            config_lines.extend(["", "search_path:"] + search_paths + [""])
+        dest = realpath_posix(dest)
+        os.makedirs(os.path.dirname(dest), exist_ok=True)
+
+        # stream the serialized config, only keep a copy if it is asked for
+        written = [] if return_config else None
+        with open(dest, "w") as f:
+            for line in io.StringIO(self._ocio_config.serialize()):
+                if "search_path" in line:
+                    line = search_block
+                f.write(line)
+                if written is not None:
+                    written.append(line)
 
-        final_config = "\n".join(config_lines)
-        dest = Path(dest).resolve()
-        dest.parent.mkdir(exist_ok=True, parents=True)
-        with open(dest.as_posix(), "w") as f:
-            f.write(final_config)
-        return final_config
+        if written is not None:
+            return "".join(written)
 
     def create_config(self, dest: str = None) -> None:
         if not dest:
             dest = Path(self.staging_dir, self._ocio_config_name)
-        dest = Path(dest).resolve().as_posix()
-        self.load_config_from_file(self._config_path.resolve().as_posix())
+        dest = realpath_posix(dest)
+        self.load_config_from_file(self._config_file)
 
         for op in self._operators:
             self._ocio_transforms.append(op)
@@ -271,7 +311,7 @@ class OCIOConfigFileGenerator:
         self._get_absolute_search_paths()
         self._change_src_paths_to_names()
         self.process_config()
-        self.write_config(dest)
+        self.write_config(dest, return_config=False)
         self._dest_path = dest
         return dest
 
@@ -1,15 +1,20 @@
 from __future__ import annotations
 
+import os
 import re
 import logging
+import functools
+from operator import attrgetter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import Dict, List
-
-import opentimelineio.opentime as opentime
+from typing import TYPE_CHECKING, Dict, List
 
 from . import utils
 
+if TYPE_CHECKING:
+    import opentimelineio.opentime as opentime
+
 IMAGE_INFO_DEFAULTS = {
     "width": 1920,
     "height": 1080,
@@ -23,8 +28,9 @@ IMAGE_INFO_DEFAULTS = {
     "display_height": 1080,
 }
 
+SUPPORTED_SEQUENCE_EXTENSIONS = frozenset({".exr"})
+
 log = logging.getLogger(__name__)
-log.setLevel(logging.DEBUG)
 
 
 @dataclass
@@ -65,14 +71,17 @@ class ImageInfo:
               files.
         """
         iinfo_res = utils.call_iinfo(self.path)
-        ffprobe_res = utils.call_ffprobe(self.path)
+        # ffprobe values are only ever used to override iinfo ones
+        ffprobe_res = utils.call_ffprobe(self.path) if force_ffprobe else {}
 
-        for k, v in iinfo_res.items():
-            if not v:
-                continue
-            if ffprobe_res.get(k) and force_ffprobe:
-                v = ffprobe_res[k]
-            setattr(self, k, v)
+        # all fields are plain attributes, so update them in one go
+        self.__dict__.update(
+            {
+                k: ffprobe_res.get(k) or v
+                for k, v in iinfo_res.items()
+                if v
+            }
+        )
 
     @property
     def filename(self) -> str:
@@ -80,12 +89,15 @@ class ImageInfo:
 
     @property
     def rational_time(self) -> opentime.RationalTime:
+        # imported lazily since otio is only needed for timecode math
+        import opentimelineio.opentime as opentime
+
         if not all([self.timecode, self.fps]):
             raise Exception("no timecode and fps found")
 
         return opentime.from_timecode(self.timecode, self.fps)
 
-    @property
+    @functools.cached_property
     def frame_number(self) -> int:
         if not self.filename:
             raise Exception("needs filename for querying frame number")
@@ -130,12 +142,14 @@ class SequenceInfo:
         if not directory.is_dir():
             raise NotImplementedError(f"{directory} is no directory")
 
-        files_map: Dict[Path, ImageInfo] = {}
+        # resolve once so frames are probed with absolute paths
+        resolved_directory = directory.resolve()
+        files_map: Dict[Path, List[Path]] = {}
         for item in directory.iterdir():
             if not item.is_file():
                 continue
-            if item.suffix not in (".exr"):
-                log.warning(f"{item.suffix} not in (.exr)")
+            if item.suffix not in SUPPORTED_SEQUENCE_EXTENSIONS:
+                log.warning(f"{item.suffix} not in {SUPPORTED_SEQUENCE_EXTENSIONS}")
                 continue
 
             _parts = item.stem.split(".")
@@ -146,28 +160,47 @@ class SequenceInfo:
 
             if seq_key not in files_map.keys():
                 files_map[seq_key] = []
-            files_map[seq_key].append(ImageInfo(item))
+            files_map[seq_key].append(item)
+
+        # reading metadata is bound by oiiotool subprocesses, so overlap them
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            futures_map = {
+                seq_key: [
+                    executor.submit(ImageInfo, Path(resolved_directory, item.name))
+                    for item in seq_files
+                ]
+                for seq_key, seq_files in files_map.items()
+            }
 
         return [
-            cls(path=seq_key.parent, imageinfos=seq_files)
-            for seq_key, seq_files in files_map.items()
+            cls(
+                path=seq_key.parent,
+                imageinfos=[future.result() for future in futures],
+            )
+            for seq_key, futures in futures_map.items()
         ]
 
     @property
-    def frames(self) -> List[int]:
-        return self.imageinfos
+    def frames(self) -> List[ImageInfo]:
+        """Frames sorted by frame number."""
+        # keyed on the cached frame number, no comparisons between frames
+        return sorted(self.imageinfos, key=attrgetter("frame_number"))
+
+    @property
+    def first_frame(self) -> ImageInfo:
+        return min(self.imageinfos, key=attrgetter("frame_number"))
 
     @property
     def start_frame(self) -> int:
-        return min(self.frames).frame_number
+        return min(map(attrgetter("frame_number"), self.imageinfos))
 
     @property
     def end_frame(self) -> int:
-        return max(self.frames).frame_number
+        return max(map(attrgetter("frame_number"), self.imageinfos))
 
     @property
     def format_string(self) -> str:
-        frame: ImageInfo = min(self.frames)
+        frame: ImageInfo = self.first_frame
         ext: str = frame.extension
         basename = frame.name.split(".")[0]
 
@@ -176,34 +209,23 @@ class SequenceInfo:
 
     @property
     def hash_string(self) -> str:
-        frame: ImageInfo = min(self.frames)
+        frame: ImageInfo = self.first_frame
         ext: str = frame.extension
         basename = frame.name.split(".")[0]
 
         result = f"{basename}.{self.start_frame}-{self.end_frame}#{ext}"
         return result
 
-    @property
-    def format_string(self) -> str:
-        frame: ImageInfo = min(self.frames)
-        ext: str = frame.extension
-        basename = frame.name.split(".")[0]
-
-        result = f"{basename}.%0{self.padding}d{ext}"
-        return result
-
     @property
     def padding(self) -> int:
-        frame = min(self.frames)
+        frame = self.first_frame
         result = len(str(frame.frame_number))
         return result
 
     @property
     def frames_missing(self) -> bool:
-        start = min(self.frames).frame_number
-        end = max(self.frames).frame_number
-        expected: int = len(range(start, end)) + 1
-        return not expected == len(self.frames)
+        expected: int = self.end_frame - self.start_frame + 1
+        return not expected == len(self.imageinfos)
 
     @property
     def width(self) -> int:
@@ -1,20 +1,40 @@
 from __future__ import annotations
 import os
+import sys
+import json
 import math
 import uuid
 import logging
+import shutil
+import functools
 import subprocess
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, List, Optional
 
-import opentimelineio as otio
+try:
+    # optional, noticeably faster decoding of large AYON exports
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 
 log = logging.getLogger(__name__)
-log.setLevel(logging.DEBUG)
 
+# `slots` is only accepted by dataclasses from Python 3.10 on
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-def get_vendored_env() -> None:
+
+# environment variables the vendored env is derived from
+_VENDORED_ENV_KEYS = ("OCIO", "LABLIB_OIIO", "LABLIB_FFMPEG", "PATH")
+
+
+def _vendored_env_key() -> tuple:
+    return tuple(os.environ.get(k) for k in _VENDORED_ENV_KEYS)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_vendored_env(env_key: tuple) -> dict:
+    # `env_key` only serves as the cache key, rebuild when it changes
     _parts = Path(__file__).parts[:-3]
     vendor_root = Path(*_parts, "vendor")
 
@@ -60,9 +80,26 @@ def get_vendored_env() -> None:
     return env
 
 
+def get_vendored_env() -> dict:
+    """Return a copy of the environment with vendored binaries and config.
+
+    The environment is only rebuilt when one of the variables it is
+    derived from changes.
+    """
+    return dict(_get_vendored_env(_vendored_env_key()))
+
+
+@functools.lru_cache(maxsize=None)
+def _which(executable: str, path: str) -> str:
+    return shutil.which(executable, path=path) or executable
+
+
 def call_cmd(cmd: List[str], timeout=None, retries=0) -> Optional[str]:
     out, err, proc = None, None, None
-    env = get_vendored_env()
+    # read-only use, no need for a copy
+    env = _get_vendored_env(_vendored_env_key())
+    # resolve the executable ourselves so no shell is spawned for lookup
+    cmd = [_which(cmd[0], env["PATH"]), *cmd[1:]]
 
     for retry in range(retries + 1):
         try:
@@ -70,62 +107,151 @@ def call_cmd(cmd: List[str], timeout=None, retries=0) -> Optional[str]:
                 cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                shell=True,
                 env=env,
                 text=True,
             )
             out, err = proc.communicate(timeout=timeout)
+            break
+        except FileNotFoundError as error:
+            raise RuntimeError(
+                f"{cmd[0]} not found, check the vendored environment and PATH"
+            ) from error
         except subprocess.TimeoutExpired:
-            log.warning(f"{cmd[0]} timed out: retry {retry+1}/{retries}")
             proc.kill()
-            continue
+            proc.communicate()
+            if retry == retries:
+                raise
+            log.warning(f"{cmd[0]} timed out: retry {retry+1}/{retries}")
 
     return out, err
 
 
-def call_iinfo(filepath: str | Path) -> dict:
+def _parse_iinfo_size(value: str, result: dict) -> None:
+    vars = value.split(",")
+    size = vars[0].split("x")
+    channels = vars[1].split()
+    result["width"] = result["display_width"] = int(size[0])
+    result["height"] = result["display_height"] = int(size[1])
+    result["channels"] = int(channels[0])
+
+
+def _parse_iinfo_fps(value: str, result: dict) -> None:
+    num, _, den = value.split(" ", 1)[0].partition("/")
+    result["fps"] = float(round(int(num) / int(den), 3))
+
+
+def _parse_iinfo_display_size(value: str, result: dict) -> None:
+    size = value.split("x")
+    result["display_width"] = int(size[0])
+    result["display_height"] = int(size[1])
+
+
+def _parse_iinfo_origin(value: str, result: dict) -> None:
+    origin = value.split(",")
+    result["origin_x"] = int(origin[0].replace("x=", ""))
+    result["origin_y"] = int(origin[1].replace("y=", ""))
+
+
+def _parse_iinfo_timecode(value: str, result: dict) -> None:
+    result["timecode"] = value
+
+
+def _parse_iinfo_par(value: str, result: dict) -> None:
+    result["par"] = float(value)
+
+
+_IINFO_HANDLERS = {
+    "FramesPerSecond": _parse_iinfo_fps,
+    "framesPerSecond": _parse_iinfo_fps,
+    "full/display size": _parse_iinfo_display_size,
+    "pixel data origin": _parse_iinfo_origin,
+    "smpte:TimeCode": _parse_iinfo_timecode,
+    "PixelAspectRatio": _parse_iinfo_par,
+}
+
+
+def _get_abspath(filepath: str | Path) -> str:
     if isinstance(filepath, str):
         filepath = Path(filepath)
-    abspath = str(filepath.resolve())
+    # resolving walks every path component, skip it for absolute paths
+    if filepath.is_absolute():
+        return os.fspath(filepath)
+    return str(filepath.resolve())
+
+
+def _get_file_signature(abspath: str) -> tuple:
+    try:
+        stat = os.stat(abspath)
+    except OSError:
+        return None, None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class _EmptyProbe(Exception):
+    """Raised by the cached probes so empty results are never memoized."""
+
+
+def _probe(cached_func, filepath: str | Path) -> dict:
+    abspath = _get_abspath(filepath)
+    signature = _get_file_signature(abspath)
+    # without a signature nothing would invalidate the entry, skip the cache
+    if signature[0] is None:
+        probe_func = cached_func.__wrapped__
+    else:
+        probe_func = cached_func
+    try:
+        return dict(probe_func(abspath, *signature))
+    except _EmptyProbe:
+        return {}
 
+
+def call_iinfo(filepath: str | Path) -> dict:
+    return _probe(_call_iinfo, filepath)
+
+
+@functools.lru_cache(maxsize=4096)
+def _call_iinfo(abspath: str, mtime_ns: int, size: int) -> dict:
+    # `mtime_ns` and `size` only invalidate the cache when the file changes
     cmd = ["oiiotool", "--info", "-v", abspath]
     cmd_out, _ = call_cmd(cmd, timeout=3, retries=3)
 
     result = {}
     for line in cmd_out.splitlines():
-        log.debug(f"oiiotool {line = }")
-        if abspath in line and line.find(abspath) < 2:
-            vars = line.split(": ")[1].split(",")
-            size = vars[0].strip().split("x")
-            channels = vars[1].strip().split(" ")
-            result["width"] = int(size[0].strip())
-            result["height"] = int(size[1].strip())
-            result["display_width"] = int(size[0].strip())
-            result["display_height"] = int(size[1].strip())
-            result["channels"] = int(channels[0].strip())
-        if "FramesPerSecond" in line or "framesPerSecond" in line:
-            vars = line.split(": ")[1].strip().split(" ")[0].split("/")
-            result["fps"] = float(round(float(int(vars[0]) / int(vars[1])), 3))
-        if "full/display size" in line:
-            size = line.split(": ")[1].split("x")
-            result["display_width"] = int(size[0].strip())
-            result["display_height"] = int(size[1].strip())
-        if "pixel data origin" in line:
-            origin = line.split(": ")[1].strip().split(",")
-            result["origin_x"] = (int(origin[0].replace("x=", "").strip()),)
-            result["origin_y"] = (int(origin[1].replace("y=", "").strip()),)
-        if "smpte:TimeCode" in line:
-            result["timecode"] = line.split(": ")[1].strip()
-        if "PixelAspectRatio" in line:
-            result["par"] = float(line.split(": ")[1].strip())
-
+        log.debug("oiiotool line = %r", line)
+        key, _, value = line.partition(": ")
+        key = key.strip()
+        # the header line is keyed by the file path itself
+        if key == abspath:
+            handler = _parse_iinfo_size
+        else:
+            handler = _IINFO_HANDLERS.get(key)
+        if handler:
+            handler(value.strip(), result)
+
+    if not result:
+        raise _EmptyProbe(abspath)
     return result
 
 
+def _parse_ffprobe_rate(value: str) -> float:
+    num, _, den = value.partition("/")
+    return float(round(int(num) / int(den), 3))
+
+
+def _parse_ffprobe_par(value: str) -> float:
+    if value == "N/A":
+        return 1
+    num, _, den = value.partition(":")
+    return float(int(num) / int(den))
+
+
 def call_ffprobe(filepath: str | Path) -> dict:
-    if isinstance(filepath, str):
-        filepath = Path(filepath)
-    abspath = str(filepath.resolve())
+    return _probe(_call_ffprobe, filepath)
+
+
+@functools.lru_cache(maxsize=4096)
+def _call_ffprobe(abspath: str, mtime_ns: int, size: int) -> dict:
+    # `mtime_ns` and `size` only invalidate the cache when the file changes
     cmd = [
         "ffprobe",
         "-v",
@@ -133,35 +259,36 @@ def call_ffprobe(filepath: str | Path) -> dict:
         "-select_streams",
         "v:0",
         "-show_entries",
-        "format_tags=timecode:stream_tags=timecode:stream=width,height,r_frame_rate,sample_aspect_ratio",
+        "stream=width,height,r_frame_rate,sample_aspect_ratio:stream_tags=timecode:format_tags=timecode",
         "-of",
-        "default=noprint_wrappers=1",
+        "json",
         abspath,
     ]
     cmd_out, _ = call_cmd(cmd, timeout=3, retries=3)
+    log.debug("ffprobe cmd_out = %r", cmd_out)
 
-    result = {}
-    for line in cmd_out.splitlines():
-        log.debug(f"ffprobe {line = }")
-        vars = line.split("=")
-        if "width" in vars[0]:
-            result["display_width"] = int(vars[1].strip())
-        if "height" in vars[0]:
-            result["display_height"] = int(vars[1].strip())
-        if "r_frame_rate" in vars[0]:
-            rate = vars[1].split("/")
-            result["fps"] = float(
-                round(float(int(rate[0].strip()) / int(rate[1].strip())), 3)
-            )
-        if "timecode" in line:
-            result["timecode"] = vars[1]
-        if "sample_aspect_ratio" in line:
-            par = vars[1].split(":")
-            if vars[1] != "N/A":
-                result["par"] = float(int(par[0].strip()) / int(par[1].strip()))
-            else:
-                result["par"] = 1
+    if not cmd_out:
+        raise _EmptyProbe(abspath)
 
+    result = {}
+    data = json.loads(cmd_out)
+    stream = (data.get("streams") or [{}])[0]
+    if "width" in stream:
+        result["display_width"] = int(stream["width"])
+    if "height" in stream:
+        result["display_height"] = int(stream["height"])
+    if "r_frame_rate" in stream:
+        result["fps"] = _parse_ffprobe_rate(stream["r_frame_rate"])
+    if "sample_aspect_ratio" in stream:
+        result["par"] = _parse_ffprobe_par(stream["sample_aspect_ratio"])
+    # format level timecode wins over the stream one
+    timecode = data.get("format", {}).get("tags", {}).get("timecode")
+    timecode = timecode or stream.get("tags", {}).get("timecode")
+    if timecode:
+        result["timecode"] = timecode
+
+    if not result:
+        raise _EmptyProbe(abspath)
     return result
 
 
@@ -173,6 +300,9 @@ class format_dict(dict):
 
 
 def offset_timecode(tc: str, frame_offset: int = None, fps: float = None) -> str:
+    # imported lazily since otio is only needed for timecode math
+    import opentimelineio as otio
+
     if not frame_offset:
         frame_offset = -1
     if not fps:
@@ -192,6 +322,31 @@ def get_staging_dir() -> str:
     )
 
 
+def realpath_posix(path: str | Path) -> str:
+    # same result as Path(path).resolve().as_posix(), without the Path objects
+    path = os.path.realpath(path)
+    return path.replace(os.sep, "/") if os.sep != "/" else path
+
+
+def load_json(filepath: str | Path) -> dict:
+    # a single read() is cheaper than json.load's buffered reads
+    with open(filepath, "rb") as f:
+        return _json_loads(f.read())
+
+
+def find_file(root: str, match: Callable[[str], bool]) -> Optional[str]:
+    """Return the first file under root whose name satisfies match.
+
+    Directories are walked top-down and the walk stops at the first hit,
+    so files next to root win over files in its subdirectories.
+    """
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            if match(name):
+                return os.path.join(dirpath, name)
+    return None
+
+
 def zero_matrix() -> List[List[float]]:
     return [[0.0] * 3 for _ in range(3)]
 
@@ -221,42 +376,30 @@ def mirror_matrix(x: bool = False) -> List[List[float]]:
 
 
 def mult_matrix(m1: List[List[float]], m2: List[List[float]]) -> List[List[float]]:
+    # transpose m2 once instead of once per row of m1
+    m2_cols = tuple(zip(*m2))
     return [
-        [sum(a * b for a, b in zip(m1_row, m2_col)) for m2_col in zip(*m2)]
+        [sum(a * b for a, b in zip(m1_row, m2_col)) for m2_col in m2_cols]
         for m1_row in m1
     ]
 
 
 def mult_matrix_vector(m: List[List[float]], v: List[float]) -> List[float]:
-    result = [0.0, 0.0, 0.0]
-    for i in range(len(m)):
-        for j in range(len(v)):
-            result[i] += m[i][j] * v[j]
-    return result
+    return [sum(a * b for a, b in zip(row, v)) for row in m]
 
 
 def flip_matrix(w: float) -> List[List[float]]:
-    result = identity_matrix()
-    chain = [translate_matrix([w, 0.0]), mirror_matrix(x=True)]
-    for m in chain:
-        result = mult_matrix(result, m)
-    return result
+    # translate([w, 0]) * mirror_matrix(x=True)
+    return [[-1.0, 0.0, float(w)], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]]
 
 
 def flop_matrix(h: float) -> List[List[float]]:
-    result = identity_matrix()
-    chain = [translate_matrix([0.0, h]), mirror_matrix()]
-    for m in chain:
-        result = mult_matrix(result, m)
-    return result
+    # translate([0, h]) * mirror_matrix()
+    return [[1.0, 0.0, 0.0], [0.0, -1.0, float(h)], [0.0, 0.0, 1.0]]
 
 
 def transpose_matrix(m: List[List[float]]) -> List[List[float]]:
-    res = identity_matrix()
-    for i in range(len(m)):
-        for j in range(len(m[0])):
-            res[i][j] = m[j][i]
-    return res
+    return [list(col) for col in zip(*m)]
 
 
 def matrix_to_44(m: List[List[float]]) -> List[List[float]]:
@@ -269,19 +412,11 @@ def matrix_to_44(m: List[List[float]]) -> List[List[float]]:
 
 
 def matrix_to_list(m: List[List[float]]) -> List[float]:
-    result = []
-    for i in m:
-        for j in i:
-            result.append(str(j))
-    return result
+    return [str(value) for row in m for value in row]
 
 
 def matrix_to_csv(m: List[List[float]]) -> str:
-    l = []
-    for i in m:
-        for k in i:
-            l.append(str(k))
-    return ",".join(l)
+    return ",".join([str(value) for row in m for value in row])
 
 
 def matrix_to_cornerpin(
@@ -292,26 +427,61 @@ def matrix_to_cornerpin(
         corners = [[0, h, 1], [w, h, 1], [0, 0, 1], [w, 0, 1]]
     else:
         corners = [[0, 0, 1], [w, 0, 1], [0, h, 1], [w, h, 1]]
-    transformed_corners = [mult_matrix_vector(m, corner) for corner in corners]
-    transformed_corners = [
-        [corner[0] / corner[2], corner[1] / corner[2]] for corner in transformed_corners
-    ]
-    for corner in transformed_corners:
-        cornerpin.extend(corner)
+    for corner in corners:
+        x, y, z = mult_matrix_vector(m, corner)
+        cornerpin.extend((x / z, y / z))
     return cornerpin
 
 
 def calculate_matrix(
     t: List[float], r: float, s: List[float], c: List[float]
 ) -> List[List[float]]:
-    c_inv = [-c[0], -c[1]]
-    center = translate_matrix(c)
-    center_inv = translate_matrix(c_inv)
-    translate = translate_matrix(t)
-    rotate = rotate_matrix(r)
-    scale = scale_matrix(s)
-    result = mult_matrix(translate, center)
-    result = mult_matrix(result, scale)
-    result = mult_matrix(result, rotate)
-    result = mult_matrix(result, center_inv)
-    return result
+    """Closed form of translate * center * scale * rotate * center_inv."""
+    if r == 0:
+        # most effect transforms do not rotate, skip the trig calls
+        cos, sin = 1.0, 0.0
+    else:
+        rad = math.radians(r)
+        cos = math.cos(rad)
+        sin = math.sin(rad)
+    # `+ 0.0` folds -0.0 into 0.0, same as the summed matrix products did
+    m00 = s[0] * cos + 0.0
+    m01 = -s[0] * sin + 0.0
+    m10 = s[1] * sin + 0.0
+    m11 = s[1] * cos + 0.0
+    m02 = m00 * -c[0] + m01 * -c[1] + (c[0] + t[0])
+    m12 = m10 * -c[0] + m11 * -c[1] + (c[1] + t[1])
+    return [[m00, m01, m02], [m10, m11, m12], [0.0, 0.0, 1.0]]
+
+
+def homography_matrix(
+    src: List[List[float]], dst: List[List[float]]
+) -> List[List[float]]:
+    """Perspective matrix mapping four src corners onto four dst corners.
+
+    Solves the 8x8 DLT system with Gaussian elimination, raises
+    ValueError when the corners are degenerate.
+    """
+    rows = []
+    for (x, y), (u, v) in zip(src, dst):
+        rows.append([x, y, 1.0, 0.0, 0.0, 0.0, -x * u, -y * u, u])
+        rows.append([0.0, 0.0, 0.0, x, y, 1.0, -x * v, -y * v, v])
+
+    for col in range(8):
+        pivot = max(range(col, 8), key=lambda i: abs(rows[i][col]))
+        if abs(rows[pivot][col]) < 1e-12:
+            raise ValueError("Corners do not define a homography")
+        rows[col], rows[pivot] = rows[pivot], rows[col]
+        pivot_row = rows[col]
+        for i in range(col + 1, 8):
+            factor = rows[i][col] / pivot_row[col]
+            if factor:
+                row = rows[i]
+                for j in range(col, 9):
+                    row[j] -= factor * pivot_row[j]
+
+    h = [0.0] * 8
+    for i in range(7, -1, -1):
+        row = rows[i]
+        h[i] = (row[8] - sum(row[j] * h[j] for j in range(i + 1, 8))) / row[i]
+    return [h[0:3], h[3:6], [h[6], h[7], 1.0]]
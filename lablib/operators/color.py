@@ -1,30 +1,72 @@
+import sys
 from dataclasses import dataclass, field
-from pathlib import Path
-from typing import List, Optional, Union
+from typing import List, Optional, Tuple
 
 import PyOpenColorIO as OCIO
 
+from lablib.lib.utils import DATACLASS_SLOTS, realpath_posix
+from .utils import get_direction, get_interpolation
 
-def get_direction(direction: Union[str, int]) -> int:
-    if direction == "inverse":
-        return OCIO.TransformDirection.TRANSFORM_DIR_INVERSE
-    return OCIO.TransformDirection.TRANSFORM_DIR_FORWARD
 
+# resolved once instead of walking the OCIO module on every call; the
+# constructors are called positionally, pybind11 parses keywords slower.
+# Built transforms are never shared between calls: consumers such as the
+# OCIO config generator edit them in place with setSrc()/setCCCId()
+_FileTransform = OCIO.FileTransform
+_ColorSpaceTransform = OCIO.ColorSpaceTransform
+_CDLTransform = OCIO.CDLTransform
+_GroupTransform = OCIO.GroupTransform
 
-def get_interpolation(interpolation: str) -> int:
-    if interpolation == "linear":
-        return OCIO.Interpolation.INTERP_LINEAR
-    elif interpolation == "best":
-        return OCIO.Interpolation.INTERP_BEST
-    elif interpolation == "nearest":
-        return OCIO.Interpolation.INTERP_NEAREST
-    elif interpolation == "tetrahedral":
-        return OCIO.Interpolation.INTERP_TETRAHEDRAL
-    elif interpolation == "cubic":
-        return OCIO.Interpolation.INTERP_CUBIC
-    return OCIO.Interpolation.INTERP_DEFAULT
+_ZERO3 = (0.0, 0.0, 0.0)
+_ONE3 = (1.0, 1.0, 1.0)
 
-@dataclass
+
+def build_ocio_transforms(ops: List) -> List:
+    """Convert color operators into one flat list of OCIO transforms."""
+    return [xfm for op in ops for xfm in op.to_ocio_obj()]
+
+
+def get_oiio_args(ops: List) -> List[str]:
+    """Collect oiiotool args for a chain of color operators.
+
+    Only file and colorspace transforms have an oiiotool equivalent, any
+    other transform in the chain is skipped.
+    """
+    args = []
+    for xfm in build_ocio_transforms(ops):
+        if isinstance(xfm, _FileTransform):
+            lut = realpath_posix(xfm.getSrc())
+            args.extend(["--ociofiletransform", lut])
+        elif isinstance(xfm, _ColorSpaceTransform):
+            args.extend(["--colorconvert", xfm.getSrc(), xfm.getDst()])
+    return args
+
+
+def _intern_colorspace(spec: dict) -> dict:
+    # interned names let the look loop compare colorspaces by identity first
+    colorspace = spec.get("colorspace")
+    if not isinstance(colorspace, str):
+        return spec
+    return {**spec, "colorspace": sys.intern(colorspace)}
+
+
+def _intern_look_item(item: dict) -> dict:
+    item = dict(item)
+    for key in ("input_colorspace", "output_colorspace"):
+        if isinstance(item.get(key), dict):
+            item[key] = _intern_colorspace(item[key])
+    for key in ("direction", "interpolation"):
+        if isinstance(item.get(key), str):
+            item[key] = sys.intern(item[key])
+    return item
+
+
+def _as_posix(path: str) -> str:
+    # cheaper than Path(path).as_posix() for plain separator normalization
+    return path.replace("\\", "/") if "\\" in path else path
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class OCIOFileTransform:
     """Foundry Hiero Timeline soft effect node class """
     file: str = ""
@@ -32,6 +74,17 @@ class OCIOFileTransform:
     direction: int = 0
     interpolation: str = "linear"
 
+    _posix_file: str = field(
+        default="", init=False, repr=False, compare=False
+    )
+
+    _DEFAULTS = {
+        "file": "", "cccid": "", "direction": 0, "interpolation": "linear"
+    }
+
+    def __post_init__(self):
+        object.__setattr__(self, "_posix_file", _as_posix(self.file))
+
     def to_ocio_obj(self):
         # define direction
         direction = get_direction(self.direction)
@@ -40,48 +93,43 @@ class OCIOFileTransform:
         interpolation = get_interpolation(self.interpolation)
 
         return [
-            OCIO.FileTransform(
-                src=Path(self.file).as_posix(),
-                cccId=self.cccid,
-                direction=direction,
-                interpolation=interpolation,
+            _FileTransform(
+                self._posix_file, self.cccid, interpolation, direction
             )
         ]
 
     @classmethod
     def from_node_data(cls, data):
-        return cls(
-            file=data.get("file", ""),
-            cccid=data.get("cccid", ""),
-            direction=data.get("direction", 0),
-            interpolation=data.get("interpolation", "linear")
-        )
+        kwargs = {**cls._DEFAULTS}
+        kwargs.update((k, data[k]) for k in cls._DEFAULTS if k in data)
+        return cls(**kwargs)
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class OCIOColorSpace:
     """Foundry Hiero Timeline soft effect node class"""
 
     in_colorspace: str = "ACES - ACEScg"
     out_colorspace: str = "ACES - ACEScg"
 
+    _DEFAULTS = {"in_colorspace": "", "out_colorspace": ""}
+
     def to_ocio_obj(self):
+        # identity conversion, nothing to wire into the chain
+        if self.in_colorspace == self.out_colorspace:
+            return []
         return [
-            OCIO.ColorSpaceTransform(
-                src=self.in_colorspace,
-                dst=self.out_colorspace,
-            )
+            _ColorSpaceTransform(self.in_colorspace, self.out_colorspace)
         ]
 
     @classmethod
     def from_node_data(cls, data):
-        return cls(
-            in_colorspace=data.get("in_colorspace", ""),
-            out_colorspace=data.get("out_colorspace", ""),
-        )
+        kwargs = {**cls._DEFAULTS}
+        kwargs.update((k, data[k]) for k in cls._DEFAULTS if k in data)
+        return cls(**kwargs)
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class OCIOCDLTransform:
     """Foundry Hiero Timeline soft effect node class.
 
@@ -92,12 +140,32 @@ class OCIOCDLTransform:
     file: Optional[str] = None
     direction: int = 0
     cccid: str = ""
-    offset: List[float] = field(default_factory=lambda: [0.0, 0.0, 0.0])
-    power: List[float] = field(default_factory=lambda: [1.0, 1.0, 1.0])
-    slope: List[float] = field(default_factory=lambda: [0.0, 0.0, 0.0])
+    offset: Tuple[float, float, float] = _ZERO3
+    power: Tuple[float, float, float] = _ONE3
+    slope: Tuple[float, float, float] = _ZERO3
     saturation: float = 1.0
     interpolation: str = "linear"
 
+    _posix_file: str = field(
+        default="", init=False, repr=False, compare=False
+    )
+
+    _DEFAULTS = {
+        "direction": 0,
+        "offset": _ZERO3,
+        "power": _ONE3,
+        "slope": _ZERO3,
+        "saturation": 1.0,
+    }
+    _LUT_DEFAULTS = {"file": None, "interpolation": "linear", "cccid": ""}
+
+    def __post_init__(self):
+        # lists from node data or callers would make the CDL unhashable
+        for key in ("offset", "power", "slope"):
+            object.__setattr__(self, key, tuple(getattr(self, key)))
+        if self.file:
+            object.__setattr__(self, "_posix_file", _as_posix(self.file))
+
     def to_ocio_obj(self):
         effects = []
 
@@ -107,53 +175,66 @@ class OCIOCDLTransform:
         if self.file:
             # define interpolation
             interpolation = get_interpolation(self.interpolation)
-            lut_file = Path(self.file)
 
             effects.append(
-                OCIO.FileTransform(
-                    src=lut_file.as_posix(),
-                    cccId=self.cccid,
-                    interpolation=interpolation,
-                    direction=direction,
+                _FileTransform(
+                    self._posix_file, self.cccid, interpolation, direction
                 )
             )
 
+        # identity SOP and saturation, the CDL would be a no-op
+        if (
+            self.slope == _ONE3
+            and self.offset == _ZERO3
+            and self.power == _ONE3
+            and self.saturation == 1.0
+        ):
+            return effects
+
         effects.append(
-            OCIO.CDLTransform(
-                slope=self.slope,
-                offset=self.offset,
-                power=self.power,
-                sat=self.saturation,
-                direction=direction,
+            _CDLTransform(
+                self.slope,
+                self.offset,
+                self.power,
+                self.saturation,
+                "",  # id
+                "",  # description
+                direction,
             )
         )
 
         return effects
 
+    def to_group_transform(
+        self, config: Optional[OCIO.Config] = None
+    ) -> OCIO.GroupTransform:
+        """Pack the LUT and CDL transforms into a single GroupTransform.
+
+        With `config` given, the group is run through the config's optimized
+        processor first, so OCIO can fold the ops it is able to combine.
+        A new group is built on every call, callers may edit it freely.
+        """
+        group = _GroupTransform(self.to_ocio_obj())
+        if config is None:
+            return group
+        processor = config.getProcessor(group)
+        return processor.getOptimizedProcessor(
+            OCIO.OPTIMIZATION_VERY_GOOD
+        ).createGroupTransform()
+
     @classmethod
     def from_node_data(cls, data):
+        kwargs = {**cls._DEFAULTS}
+        kwargs.update((k, data[k]) for k in cls._DEFAULTS if k in data)
+        # LUT related values only matter when there is a LUT file
         if data.get("file"):
-            return cls(
-                file=data.get("file", ""),
-                interpolation=data.get("interpolation", "linear"),
-                direction=data.get("direction", 0),
-                offset=data.get("offset", [0.0, 0.0, 0.0]),
-                power=data.get("power", [1.0, 1.0, 1.0]),
-                slope=data.get("slope", [0.0, 0.0, 0.0]),
-                saturation=data.get("saturation", 1.0),
-                cccid=data.get("cccid", ""),
-            )
-        else:
-            return cls(
-                direction=data.get("direction", 0),
-                offset=data.get("offset", [0.0, 0.0, 0.0]),
-                power=data.get("power", [1.0, 1.0, 1.0]),
-                slope=data.get("slope", [0.0, 0.0, 0.0]),
-                saturation=data.get("saturation", 1.0),
+            kwargs.update(
+                (k, data[k]) for k in cls._LUT_DEFAULTS if k in data
             )
+        return cls(**kwargs)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class AYONOCIOLookProduct:
     """AYON ocioLook product dataclass
 
@@ -197,47 +278,61 @@ class AYONOCIOLookProduct:
     ocioLookItems: List[dict] = field(default_factory=list)
     ocioLookWorkingSpace: dict = field(default_factory=dict)
 
+    def __post_init__(self):
+        # intern on every construction path, not only from node data
+        self.ocioLookItems = [
+            _intern_look_item(item) for item in self.ocioLookItems
+        ]
+        self.ocioLookWorkingSpace = _intern_colorspace(
+            self.ocioLookWorkingSpace
+        )
+
     def to_ocio_obj(self):
+        items = self.ocioLookItems
+        if not items:
+            return []
+
         look_working_colorspace = self.ocioLookWorkingSpace["colorspace"]
-        all_transformations = []
-        for index, item in enumerate(self.ocioLookItems):
+        # start the chain from the look working colorspace
+        current_working_colorspace = look_working_colorspace
+        # OCIO objects are built fresh on every call since callers like
+        # the config generator edit them in place. Every item adds at most
+        # a hop and a LUT, plus the final hop back, so the list is sized
+        # for that up front and filled by index
+        all_transformations = [None] * (2 * len(items) + 1)
+        index = 0
+        for item in items:
             filepath = item["file"]
             lut_in_colorspace = item["input_colorspace"]["colorspace"]
             lut_out_colorspace = item["output_colorspace"]["colorspace"]
             direction = item["direction"]
             interpolation = item["interpolation"]
 
-            if index == 0:
-                # set the first colorspace as the current working colorspace
-                current_working_colorspace = look_working_colorspace
-
             if current_working_colorspace != lut_in_colorspace:
-                all_transformations.append(
-                    OCIO.ColorSpaceTransform(
-                        src=current_working_colorspace,
-                        dst=lut_in_colorspace,
-                    )
+                all_transformations[index] = _ColorSpaceTransform(
+                    current_working_colorspace, lut_in_colorspace
                 )
+                index += 1
 
-            all_transformations.append(
-                OCIO.FileTransform(
-                    src=Path(filepath).as_posix(),
-                    interpolation=get_interpolation(interpolation),
-                    direction=get_direction(direction),
-                )
+            all_transformations[index] = _FileTransform(
+                _as_posix(filepath),
+                "",  # cccId
+                get_interpolation(interpolation),
+                get_direction(direction),
             )
+            index += 1
 
             current_working_colorspace = lut_out_colorspace
 
         # making sure we are back in the working colorspace
         if current_working_colorspace != look_working_colorspace:
-            all_transformations.append(
-                OCIO.ColorSpaceTransform(
-                    src=current_working_colorspace,
-                    dst=look_working_colorspace,
-                )
+            all_transformations[index] = _ColorSpaceTransform(
+                current_working_colorspace, look_working_colorspace
             )
+            index += 1
 
+        # skipped hops leave unused slots at the end, drop them in place
+        del all_transformations[index:]
         return all_transformations
 
     @classmethod
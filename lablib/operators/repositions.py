@@ -1,115 +1,236 @@
+import functools
 from dataclasses import dataclass, field
-from typing import List
+from typing import List, Tuple
 
 from lablib.lib.utils import (
-    identity_matrix,
+    DATACLASS_SLOTS,
     transpose_matrix,
     matrix_to_csv,
     calculate_matrix,
     mult_matrix,
+    homography_matrix,
 )
 
 
-@dataclass
+# oiiotool args for every (flop, flip) combination, indexed by flop << 1 | flip
+_MIRROR_ARGS = ((), ("--flip",), ("--flop",), ("--flop", "--flip"))
+
+_WARP_FLAG = "--warp:filter=cubic:recompute_roi=1"  # TODO: expose filter
+
+
+@functools.lru_cache(maxsize=1024)
+def _compute_warp(
+    translate, rotate, scale, center, allow_shortcuts=True
+) -> Tuple[str, ...]:
+    # the same transform repeats across shots and effect stacks
+    if allow_shortcuts and rotate == 0.0 and scale == (1.0, 1.0):
+        tx, ty = translate
+        if tx == 0.0 and ty == 0.0:
+            return ()
+        if float(tx).is_integer() and float(ty).is_integer():
+            # whole pixel shift, move the data window instead of resampling
+            return ("--originoffset", f"{int(tx):+d}{int(ty):+d}")
+
+    matrix = calculate_matrix(t=translate, r=rotate, s=scale, c=center)
+    return (
+        _WARP_FLAG,
+        matrix_to_csv(transpose_matrix(matrix)),
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _compute_cornerpin(src, dst) -> Tuple[str, ...]:
+    if src == dst:
+        return ()
+    try:
+        matrix = homography_matrix(src, dst)
+    except ValueError:
+        # collapsed corners, nothing sensible to warp to
+        return ()
+    return (
+        _WARP_FLAG,
+        matrix_to_csv(transpose_matrix(matrix)),
+    )
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class Transform:
-    translate: List[float] = field(default_factory=lambda: [0.0, 0.0])
+    translate: Tuple[float, float] = (0.0, 0.0)
     rotate: float = 0.0
-    # needs to be treated as a list of floats but can be single float
-    scale: List[float] = field(default_factory=lambda: [1.0, 1.0])
-    center: List[float] = field(default_factory=lambda: [0.0, 0.0])
+    # needs to be treated as a pair of floats but can be single float
+    scale: Tuple[float, float] = (1.0, 1.0)
+    center: Tuple[float, float] = (0.0, 0.0)
     invert: bool = False
     skewX: float = 0.0
     skewY: float = 0.0
     skew_order: str = "XY"
 
-    def to_oiio_args(self):
-        matrix = calculate_matrix(
+    # oiiotool args, computed once from the fields above
+    _warp_args: Tuple[str, ...] = field(
+        default=(), init=False, repr=False, compare=False
+    )
+
+    _DEFAULTS = {
+        "translate": (0.0, 0.0),
+        "rotate": 0.0,
+        "scale": (0.0, 0.0),
+        "center": (0.0, 0.0),
+        "invert": False,
+        "skewX": 0.0,
+        "skewY": 0.0,
+        "skew_order": "XY",
+    }
+
+    def __post_init__(self):
+        scale = self.scale
+        if isinstance(scale, (int, float)):
+            scale = (scale, scale)
+        object.__setattr__(self, "translate", tuple(self.translate))
+        object.__setattr__(self, "scale", tuple(scale))
+        object.__setattr__(self, "center", tuple(self.center))
+
+        warp_args = _compute_warp(
+            self.translate,
+            self.rotate,
+            self.scale,
+            self.center,
+            # inverted or skewed transforms stay on the general warp path
+            not (self.invert or self.skewX or self.skewY),
+        )
+        object.__setattr__(self, "_warp_args", warp_args)
+
+    def to_matrix(self) -> List[List[float]]:
+        return calculate_matrix(
             t=self.translate, r=self.rotate, s=self.scale, c=self.center
         )
-        identity = identity_matrix()
-        matrix_xfm = mult_matrix(identity, matrix)
-        matrix_tr = transpose_matrix(matrix_xfm)
-        warp_cmd = matrix_to_csv(matrix_tr)
-        warp_flag = "--warp:filter=cubic:recompute_roi=1"  # TODO: expose filter
-        return [warp_flag, warp_cmd]
+
+    def to_oiio_args(self):
+        return list(self._warp_args)
 
     @classmethod
     def from_node_data(cls, data):
-        scale = data.get("scale", [0.0, 0.0])
-        if isinstance(scale, (int, float)):
-            scale = [scale, scale]
-
-        return cls(
-            translate=data.get("translate", [0.0, 0.0]),
-            rotate=data.get("rotate", 0.0),
-            scale=scale,
-            center=data.get("center", [0.0, 0.0]),
-            invert=data.get("invert", False),
-            skewX=data.get("skewX", 0.0),
-            skewY=data.get("skewY", 0.0),
-            skew_order=data.get("skew_order", "XY"),
-        )
+        kwargs = {**cls._DEFAULTS}
+        kwargs.update((k, data[k]) for k in cls._DEFAULTS if k in data)
+        return cls(**kwargs)
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class Crop:
-    box: List[int] = field(default_factory=lambda: [0, 0, 1920, 1080])
+    box: Tuple[int, int, int, int] = (0, 0, 1920, 1080)
     # NOTE: could also be called with width, height, x, y
 
+    # crop geometry as oiiotool argument, computed once from the box
+    _crop_arg: str = field(default="", init=False, repr=False, compare=False)
+
+    _DEFAULTS = {"box": (0, 0, 1920, 1080)}
+
+    def __post_init__(self):
+        object.__setattr__(self, "box", tuple(self.box))
+        # using xmin,ymin,xmax,ymax
+        object.__setattr__(self, "_crop_arg", ",".join(map(str, self.box[:4])))
+
     def to_oiio_args(self):
-        return [
-            "--crop",
-            # using xmin,ymin,xmax,ymax
-            f"{self.box[0]},{self.box[1]},{self.box[2]},{self.box[3]}",
-        ]
+        return ["--crop", self._crop_arg]
 
     @classmethod
     def from_node_data(cls, data):
-        return cls(box=data.get("box", [0, 0, 1920, 1080]))
+        kwargs = {**cls._DEFAULTS}
+        kwargs.update((k, data[k]) for k in cls._DEFAULTS if k in data)
+        return cls(**kwargs)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Mirror2:
     flop: bool = False
     flip: bool = False
 
+    _DEFAULTS = {"flop": False, "flip": False}
+
     def to_oiio_args(self):
-        args = []
-        if self.flop:
-            args.append("--flop")
-        if self.flip:
-            args.append("--flip")
-        return args
+        return list(_MIRROR_ARGS[(bool(self.flop) << 1) | bool(self.flip)])
 
     @classmethod
     def from_node_data(cls, data):
-        return cls(flop=data.get("flop", False), flip=data.get("flip", False))
+        kwargs = {**cls._DEFAULTS}
+        kwargs.update((k, data[k]) for k in cls._DEFAULTS if k in data)
+        return cls(**kwargs)
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class CornerPin2D:
-    from1: List[float] = field(default_factory=lambda: [0.0, 0.0])
-    from2: List[float] = field(default_factory=lambda: [0.0, 0.0])
-    from3: List[float] = field(default_factory=lambda: [0.0, 0.0])
-    from4: List[float] = field(default_factory=lambda: [0.0, 0.0])
-    to1: List[float] = field(default_factory=lambda: [0.0, 0.0])
-    to2: List[float] = field(default_factory=lambda: [0.0, 0.0])
-    to3: List[float] = field(default_factory=lambda: [0.0, 0.0])
-    to4: List[float] = field(default_factory=lambda: [0.0, 0.0])
+    from1: Tuple[float, float] = (0.0, 0.0)
+    from2: Tuple[float, float] = (0.0, 0.0)
+    from3: Tuple[float, float] = (0.0, 0.0)
+    from4: Tuple[float, float] = (0.0, 0.0)
+    to1: Tuple[float, float] = (0.0, 0.0)
+    to2: Tuple[float, float] = (0.0, 0.0)
+    to3: Tuple[float, float] = (0.0, 0.0)
+    to4: Tuple[float, float] = (0.0, 0.0)
+
+    # oiiotool args, computed once from the corners above
+    _warp_args: Tuple[str, ...] = field(
+        default=(), init=False, repr=False, compare=False
+    )
+
+    _DEFAULTS = {
+        key: (0.0, 0.0)
+        for key in (
+            "from1", "from2", "from3", "from4", "to1", "to2", "to3", "to4"
+        )
+    }
+
+    def __post_init__(self):
+        for key in self._DEFAULTS:
+            object.__setattr__(self, key, tuple(getattr(self, key)))
+
+        warp_args = _compute_cornerpin(
+            (self.from1, self.from2, self.from3, self.from4),
+            (self.to1, self.to2, self.to3, self.to4),
+        )
+        object.__setattr__(self, "_warp_args", warp_args)
+
+    def to_matrix(self) -> List[List[float]]:
+        return homography_matrix(
+            (self.from1, self.from2, self.from3, self.from4),
+            (self.to1, self.to2, self.to3, self.to4),
+        )
 
     def to_oiio_args(self):
-        # TODO: use matrix operation from utils.py
-        return []
+        return list(self._warp_args)
 
     @classmethod
     def from_node_data(cls, data):
-        return cls(
-            from1=data.get("from1", [0.0, 0.0]),
-            from2=data.get("from2", [0.0, 0.0]),
-            from3=data.get("from3", [0.0, 0.0]),
-            from4=data.get("from4", [0.0, 0.0]),
-            to1=data.get("to1", [0.0, 0.0]),
-            to2=data.get("to2", [0.0, 0.0]),
-            to3=data.get("to3", [0.0, 0.0]),
-            to4=data.get("to4", [0.0, 0.0]),
-        )
+        kwargs = {**cls._DEFAULTS}
+        kwargs.update((k, data[k]) for k in cls._DEFAULTS if k in data)
+        return cls(**kwargs)
+
+
+def get_oiio_args(ops: List) -> List[str]:
+    """Collect oiiotool args for a chain of reposition operators.
+
+    Consecutive Transforms are composed into a single warp matrix, so
+    oiiotool resamples the image once per run instead of once per
+    Transform. Any other operator ends the run.
+    """
+    args = []
+    run = []
+    for op in [*ops, None]:
+        if isinstance(op, Transform):
+            run.append(op)
+            continue
+
+        if len(run) == 1:
+            args.extend(run[0].to_oiio_args())
+        elif run:
+            matrix = run[0].to_matrix()
+            for xfm in run[1:]:
+                matrix = mult_matrix(xfm.to_matrix(), matrix)
+            args.extend([
+                _WARP_FLAG,
+                matrix_to_csv(transpose_matrix(matrix)),
+            ])
+        run = []
+
+        if op is not None:
+            args.extend(op.to_oiio_args())
+    return args
@@ -0,0 +1,43 @@
+import functools
+from typing import Union
+
+
+@functools.lru_cache(maxsize=1)
+def _ocio_tables() -> tuple:
+    # OCIO is imported on the first lookup, not when this module is imported
+    import PyOpenColorIO as OCIO
+
+    directions = {
+        "inverse": OCIO.TransformDirection.TRANSFORM_DIR_INVERSE,
+        "forward": OCIO.TransformDirection.TRANSFORM_DIR_FORWARD,
+    }
+    interpolations = {
+        "linear": OCIO.Interpolation.INTERP_LINEAR,
+        "best": OCIO.Interpolation.INTERP_BEST,
+        "nearest": OCIO.Interpolation.INTERP_NEAREST,
+        "tetrahedral": OCIO.Interpolation.INTERP_TETRAHEDRAL,
+        "cubic": OCIO.Interpolation.INTERP_CUBIC,
+    }
+    return (
+        OCIO.TransformDirection,
+        directions,
+        interpolations,
+        OCIO.Interpolation.INTERP_DEFAULT,
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def get_direction(direction: Union[str, int]) -> int:
+    direction_type, directions, _, _ = _ocio_tables()
+    if isinstance(direction, int):
+        # node data stores the knob value, 0 forward and 1 inverse
+        return directions["inverse" if direction else "forward"]
+    if isinstance(direction, direction_type):
+        return direction
+    return directions.get(direction, directions["forward"])
+
+
+@functools.lru_cache(maxsize=None)
+def get_interpolation(interpolation: str) -> int:
+    _, _, interpolations, default = _ocio_tables()
+    return interpolations.get(interpolation, default)
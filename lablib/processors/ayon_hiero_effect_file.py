@@ -1,59 +1,80 @@
 from __future__ import annotations
 
-import json
+import os
 import logging
 import inspect
+import functools
+from operator import itemgetter
+from types import MappingProxyType
 
-from typing import List, Dict
+from typing import Callable, List, Dict, Optional
 from pathlib import Path
-import PyOpenColorIO as OCIO
 
 from .. import operators
+from ..lib.utils import find_file, load_json, realpath_posix
 
 log = logging.getLogger(__name__)
-log.setLevel(logging.DEBUG)
+
+# operator classes by name, resolved once from the package's public names
+_WRAPPER_CLASSES = MappingProxyType({
+    name: getattr(operators, name)
+    for name in operators.__all__
+    if inspect.isclass(getattr(operators, name))
+})
+# names of the classes producing OCIO color transforms, the rest reposition
+_COLOR_CLASSES = frozenset(
+    name
+    for name, cls in _WRAPPER_CLASSES.items()
+    if cls.__module__ == operators.color.__name__
+)
+
+
+def _find_relative_file(root: str, name: str) -> Optional[str]:
+    # the common case is a file sitting right next to the effect file
+    candidate = os.path.join(root, name)
+    if os.path.isfile(candidate):
+        return candidate
+    return find_file(root, name.__eq__)
 
 
 class AYONHieroEffectsFileProcessor(object):
     filepath: Path = None
 
-    _wrapper_class_members = dict(inspect.getmembers(operators, inspect.isclass))
-    _color_ops: List = []
-    _repo_ops: List = []
+    _color_ops: List
+    _repo_ops: List
+    # oiiotool args for the loaded ops, built on first request
+    _oiio_args: List[str]
 
     def __init__(self, filepath: Path) -> None:
         self.filepath = filepath
+        self.clear_operators()
 
     @property
     def color_operators(self) -> List:
-        ops = []
-        for op in self._color_ops:
-            ops.extend(op.to_ocio_obj())
-        return ops
+        return operators.color.build_ocio_transforms(self._color_ops)
 
     @property
     def repo_operators(self) -> Dict:
         return self._repo_ops
 
     def _load(self) -> None:
-        effect_file_path = self.filepath.resolve().as_posix()
-
-        # get all relative files recursively so we can make sure files in
-        # transforms are having correct path
-        all_relative_files = {f.name: f for f in Path(self.filepath.parent).rglob("*")}
-
-        with open(effect_file_path, "r") as f:
-            ops_data = json.load(f)
+        # look up missing transform files by name under the effect file's
+        # directory; searched only on a miss and once per name
+        find_relative_file = functools.lru_cache(maxsize=None)(
+            functools.partial(_find_relative_file, str(self.filepath.parent))
+        )
 
-        all_ops = [v for _, v in ops_data.items() if isinstance(v, dict)]
+        ops_data = load_json(self.filepath)
 
         # TODO: what if there are multiple layer citizens with subTrackIndex
-        all_ops.sort(key=lambda op: op["subTrackIndex"])
-
+        all_ops = sorted(
+            (v for v in ops_data.values() if type(v) is dict),
+            key=itemgetter("subTrackIndex"),
+        )
         for value in all_ops:
             class_name = value["class"]
-
-            if class_name not in self._wrapper_class_members.keys():
+            class_obj = _WRAPPER_CLASSES.get(class_name)
+            if class_obj is None:
                 continue
 
             if not value.get("node"):
@@ -62,49 +83,47 @@ class AYONHieroEffectsFileProcessor(object):
             node_value = value["node"]
 
             if node_value.get("file"):
-                self._sanitize_file_path(node_value, all_relative_files)
-
-            class_obj = self._wrapper_class_members[class_name]
-            class_obj = class_obj.from_node_data(node_value)
+                self._sanitize_file_path(node_value, find_relative_file)
 
             # separate color ops from repo ops
-            if "color" in class_obj.__class__.__module__:
-                self._color_ops.append(class_obj)
+            if class_name in _COLOR_CLASSES:
+                target = self._color_ops
             else:
-                self._repo_ops.append(class_obj)
+                target = self._repo_ops
+            target.append(class_obj.from_node_data(node_value))
 
-    def _sanitize_file_path(self, node_value: dict, all_relative_files: dict) -> None:
+    def _sanitize_file_path(
+        self, node_value: dict, find_relative_file: Callable[[str], str]
+    ) -> None:
         filepath = Path(node_value["file"])
         if filepath.exists():
             node_value["file"] = filepath.as_posix()
             return
-        if filepath.name not in all_relative_files.keys():
+
+        relative_file = find_relative_file(filepath.name)
+        if relative_file is None:
             return
+        relative_file = realpath_posix(relative_file)
 
-        relative_file = all_relative_files[filepath.name]
         log.warning(
             f"File not found: {filepath.name}. Using file from "
-            f"relative path instead: {relative_file.as_posix()}"
+            f"relative path instead: {relative_file}"
         )
-        node_value["file"] = relative_file.resolve().as_posix()
+        node_value["file"] = relative_file
 
     def clear_operators(self) -> None:
         self._color_ops = []
         self._repo_ops = []
+        self._oiio_args = None
 
     def load(self) -> None:
         self.clear_operators()
         self._load()
 
     def get_oiiotool_cmd(self) -> List[str]:
-        args = []
-        for op in self.color_operators:
-            if isinstance(op, OCIO.FileTransform):
-                lut = Path(op.getSrc()).resolve()
-                args.extend(["--ociofiletransform", f"{lut.as_posix()}"])
-            if isinstance(op, OCIO.ColorSpaceTransform):
-                args.extend(["--colorconvert", op.getSrc(), op.getDst()])
-        for op in self.repo_operators:
-            args.extend(op.to_oiio_args())
-
-        return args
+        if self._oiio_args is None:
+            self._oiio_args = [
+                *operators.color.get_oiio_args(self._color_ops),
+                *operators.repositions.get_oiio_args(self._repo_ops),
+            ]
+        return list(self._oiio_args)
@@ -1,22 +1,26 @@
 from __future__ import annotations
 
-import json
 import logging
+import functools
 
-from typing import List
+from typing import Callable, List, Optional
 from pathlib import Path
-import PyOpenColorIO as OCIO
 
 
-from ..operators import AYONOCIOLookProduct
+from ..operators import AYONOCIOLookProduct, color
+from ..lib.utils import find_file, load_json, realpath_posix
 
 log = logging.getLogger(__name__)
-log.setLevel(logging.DEBUG)
+
+
+def _find_file_by_extension(root: str, extension: str) -> Optional[str]:
+    return find_file(root, lambda name: name.endswith(extension))
 
 
 class AYONOCIOLookFileProcessor(object):
     filepath: Path
     operator: AYONOCIOLookProduct
+    _oiio_args: List[str]
 
     def __init__(self, filepath: Path) -> None:
         self.filepath = filepath
@@ -24,14 +28,15 @@ class AYONOCIOLookFileProcessor(object):
 
     def load(self) -> None:
         self.operator = None  # clear operator
-        ociolook_file_path = self.filepath.resolve().as_posix()
+        self._oiio_args = None
 
-        # get all relative files recursively so we can make sure files in
-        # transforms are having correct path
-        all_relative_files = {f.name: f for f in Path(self.filepath.parent).rglob("*")}
+        # look up transform files by extension under the look file's
+        # directory; the walk stops at the first match, once per extension
+        find_relative_file = functools.lru_cache(maxsize=None)(
+            functools.partial(_find_file_by_extension, str(self.filepath.parent))
+        )
 
-        with open(ociolook_file_path, "r") as f:
-            ops_data = json.load(f)
+        ops_data = load_json(self.filepath)
 
         schema_data_version = ops_data.get("version", 1)
 
@@ -44,27 +49,22 @@ class AYONOCIOLookFileProcessor(object):
         #   the filepath is not found in the data
         # add all relative files to the data
         for item in ops_data["data"]["ocioLookItems"]:
-            self._sanitize_file_path(item, all_relative_files)
+            self._sanitize_file_path(item, find_relative_file)
 
         self.operator = AYONOCIOLookProduct.from_node_data(ops_data["data"])
 
     def get_oiiotool_cmd(self) -> List[str]:
-        args = []
-        for xfm in self.operator.to_ocio_obj():
-            if isinstance(xfm, OCIO.FileTransform):
-                lut = Path(xfm.getSrc()).resolve()
-                args.extend(["--ociofiletransform", f"{lut.as_posix()}"])
-            if isinstance(xfm, OCIO.ColorSpaceTransform):
-                args.extend(["--colorconvert", xfm.getSrc(), xfm.getDst()])
-        return args
-
-    def _sanitize_file_path(self, repre_data: dict, all_relative_files: dict) -> None:  # noqa: E501
-        extension = repre_data["ext"]
-
-        for file, path in all_relative_files.items():
-            if file.endswith(extension):
-                repre_data["file"] = path.resolve().as_posix()
-                break
+        # the look is fixed once loaded, build its args only once
+        if self._oiio_args is None:
+            self._oiio_args = color.get_oiio_args([self.operator])
+        return list(self._oiio_args)
+
+    def _sanitize_file_path(
+        self, repre_data: dict, find_relative_file: Callable[[str], str]
+    ) -> None:
+        relative_file = find_relative_file(repre_data["ext"])
+        if relative_file is not None:
+            repre_data["file"] = realpath_posix(relative_file)
 
         if not repre_data.get("file"):
             log.warning(f"File not found: {repre_data['name']}.{repre_data['ext']}.")
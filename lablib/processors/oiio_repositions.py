@@ -2,26 +2,35 @@ from __future__ import annotations
 
 import inspect
 import logging
+from types import MappingProxyType
 from typing import Any, List
 
 from ..operators import repositions
 
 
 log = logging.getLogger(__name__)
-log.setLevel(logging.DEBUG)
+
+# fill modes handed to oiiotool's --fit, anything else is a plain resize
+_FIT_MODES = frozenset(("letterbox", "width", "height"))
+
+# reposition operator classes by name, collected once at import
+_WRAPPER_CLASSES = MappingProxyType(
+    dict(inspect.getmembers(repositions, inspect.isclass))
+)
 
 
 class OIIORepositionProcessor:
-    operators: List[Any] = []
+    operators: List[Any]
     src_width: int = 0
     dst_width: int = 0
     src_height: int = 0
     dst_height: int = 0
     fit: str = None
 
-    _wrapper_class_members = dict(inspect.getmembers(repositions, inspect.isclass))
+    _wrapper_class_members = _WRAPPER_CLASSES
 
     def __init__(self, **kwargs) -> None:
+        self.operators = []
         for k, v in kwargs.items():
             if hasattr(self, k):
                 setattr(self, k, v)
@@ -35,17 +44,16 @@ class OIIORepositionProcessor:
         return f"{self.__class__.__name__}({props[:-2]})"
 
     def get_oiiotool_cmd(self) -> List:
-        result = []
-        for op in self.operators:
-            result.extend(op.to_oiio_args())
+        result = repositions.get_oiio_args(self.operators)
 
         if any([self.dst_height, self.dst_width]):
             dest_size = f"{self.dst_width}x{self.dst_height}"
             # TODO: check with renderer
-            if self.fit in ["letterbox", "width", "height"]:
+            if self.fit in _FIT_MODES:
                 result.extend([f"--fit:fillmode={self.fit}", dest_size])
             else:
                 result.extend(["--resize", dest_size])
 
-        log.debug(f"{result = }")
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(f"{result = }")
         return result
@@ -11,7 +11,6 @@ from pathlib import Path
 from ..lib import SequenceInfo, utils
 
 log = logging.getLogger(__name__)
-log.setLevel(logging.DEBUG)
 
 
 SUPPORTED_CODECS = ["ProRes422-HQ", "ProRes4444-XQ", "DNxHR-SQ"]
@@ -223,7 +222,7 @@ class BasicRenderer:
         cmd.extend(input_args)
 
         # timecode args
-        timecode = min(self.source_sequence.frames).timecode
+        timecode = self.source_sequence.frames[0].timecode
         cmd.extend(["-timecode", timecode])
 
         # codec args
@@ -299,7 +298,7 @@ class BasicRenderer:
     @property
     def fps(self) -> int:
         if not hasattr(self, "_fps"):
-            return min(self.source_sequence.frames).fps
+            return self.source_sequence.frames[0].fps
         return self._fps
 
     @fps.setter
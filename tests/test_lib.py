@@ -1,9 +1,11 @@
+import shutil
 import pytest
 from pathlib import Path
 import logging
 
 from opentimelineio.opentime import RationalTime
 
+from lablib.lib import utils
 from lablib.lib import (
     ImageInfo,
     SequenceInfo,
@@ -59,3 +61,69 @@ def test_SequenceInfo_missing_frames():
     assert seq_info.end_frame == 1003
     assert seq_info.frames_missing
     # TODO: which missing frames
+
+
+def test_SequenceInfo_without_frame_number(tmp_path):
+    # a file without frame number must not break the other sequences
+    for item in Path("resources/public/plateMain/v001").glob("*.exr"):
+        shutil.copy(item, tmp_path / item.name)
+    shutil.copy(item, tmp_path / "slate.exr")
+
+    seq_infos = SequenceInfo.scan(tmp_path)
+    assert len(seq_infos) == 2
+
+    seq_info = next(
+        seq for seq in seq_infos if seq.imageinfos[0].name != "slate.exr"
+    )
+    assert seq_info.start_frame == 1001
+    assert seq_info.end_frame == 1003
+
+    # the frame range follows reassigned and in place edited frames
+    seq_info.imageinfos = seq_info.frames
+    seq_info.imageinfos.pop()
+    assert seq_info.end_frame == 1001
+    assert not seq_info.frames_missing
+
+
+def test_SequenceInfo_unsupported_extension(tmp_path):
+    # ".e" used to pass the substring check against ".exr"
+    Path(tmp_path, "BLD_010_0010_plateMain_v000.1001.e").touch()
+
+    assert SequenceInfo.scan(tmp_path) == []
+
+
+@pytest.mark.parametrize(
+    "t, r, s, c",
+    [
+        ([0.0, 0.0], 0.0, [1.075, 1.075], [2191.0, 1155.0]),
+        ([0.0, 0.0], 90.0, [0.0, 0.0], [0.0, 0.0]),
+        ([12.5, -40.0], -33.0, [0.5, 2.0], [960.0, 540.0]),
+    ],
+)
+def test_calculate_matrix(t, r, s, c):
+    # compare against the explicit chain of matrix products
+    expected = utils.mult_matrix(utils.translate_matrix(t), utils.translate_matrix(c))
+    for m in (
+        utils.scale_matrix(s),
+        utils.rotate_matrix(r),
+        utils.translate_matrix([-c[0], -c[1]]),
+    ):
+        expected = utils.mult_matrix(expected, m)
+
+    result = utils.calculate_matrix(t=t, r=r, s=s, c=c)
+    assert utils.matrix_to_csv(result) == utils.matrix_to_csv(expected)
+
+
+def test_call_cmd_missing_executable():
+    with pytest.raises(RuntimeError, match="lablib_missing_tool"):
+        utils.call_cmd(["lablib_missing_tool", "--help"])
+
+
+def test_call_iinfo_does_not_cache_failed_probes(tmp_path):
+    broken = Path(tmp_path, "broken.exr")
+    broken.write_text("not an image")
+    cached = utils._call_iinfo.cache_info().currsize
+
+    assert utils.call_iinfo(broken) == {}
+    assert utils.call_iinfo(Path(tmp_path, "missing.exr")) == {}
+    assert utils._call_iinfo.cache_info().currsize == cached
@@ -9,6 +9,7 @@ from lablib.operators import (
     OCIOCDLTransform,
     AYONOCIOLookProduct,
 )
+from lablib.operators.color import get_oiio_args
 
 log = logging.getLogger(__name__)
 
@@ -30,6 +31,12 @@ class TestColorOperators:
         ],
     )
     def test_OCIOFileTransform(self, data: dict):
+        # equal node data gives equal, hashable operators
+        assert len({
+            OCIOFileTransform.from_node_data(data),
+            OCIOFileTransform.from_node_data(data),
+        }) == 1
+
         lut_file = Path(data["file"]).as_posix()
         lut = OCIOFileTransform.from_node_data(data)
         lut_obj = lut.to_ocio_obj()
@@ -69,6 +76,26 @@ class TestColorOperators:
 
         log.debug(f"{colorspace_obj = }")
 
+    def test_OCIOColorSpace_identity(self):
+        colorspace = OCIOColorSpace(
+            in_colorspace="ACES - ACEScg",
+            out_colorspace="ACES - ACEScg",
+        )
+        assert colorspace.to_ocio_obj() == []
+
+    def test_get_oiio_args(self):
+        ops = [
+            OCIOColorSpace(
+                in_colorspace="ACES - ACEScg",
+                out_colorspace="Output - sRGB",
+            ),
+            OCIOCDLTransform(slope=[1.2, 1.1, 1.0]),
+        ]
+        # CDLs have no oiiotool equivalent and are left out
+        assert get_oiio_args(ops) == [
+            "--colorconvert", "ACES - ACEScg", "Output - sRGB",
+        ]
+
     @pytest.mark.parametrize(
         "data",
         [
@@ -77,14 +104,14 @@ class TestColorOperators:
                     "resources/public/effectPlateMain/v000/"
                     "resources/BLD_010_0010.cc"
                 ),
-                "slope": [1.0, 1.0, 1.0],
+                "slope": [1.2, 1.1, 1.0],
                 "offset": [0.0, 0.0, 0.0],
                 "power": [1.0, 1.0, 1.0],
                 "saturation": 1.0,
                 "interpolation": "nearest",
             },
             {
-                "slope": [1.0, 1.0, 1.0],
+                "slope": [1.2, 1.1, 1.0],
                 "offset": [0.0, 0.0, 0.0],
                 "power": [1.0, 1.0, 1.0],
                 "saturation": 1.0,
@@ -116,6 +143,38 @@ class TestColorOperators:
 
         log.debug(f"{cdl_obj = }")
 
+    def test_OCIOCDLTransform_group_transform(self):
+        cdl = OCIOCDLTransform(slope=(1.2, 1.1, 1.0), saturation=0.9)
+
+        group = cdl.to_group_transform()
+        assert len(group) == 1
+        # every call builds a new group, editing one leaves the next alone
+        group.appendTransform(OCIO.ExponentTransform())
+        assert len(cdl.to_group_transform()) == 1
+
+        optimized = cdl.to_group_transform(OCIO.Config.CreateRaw())
+        assert isinstance(optimized, OCIO.GroupTransform)
+
+    def test_OCIOCDLTransform_identity(self):
+        cdl = OCIOCDLTransform(
+            slope=(1.0, 1.0, 1.0),
+            offset=(0.0, 0.0, 0.0),
+            power=(1.0, 1.0, 1.0),
+            saturation=1.0,
+        )
+        assert cdl.to_ocio_obj() == []
+
+    def test_OCIOCDLTransform_from_lists(self):
+        cdl = OCIOCDLTransform(
+            slope=[1.0, 1.0, 1.0],
+            offset=[0.0, 0.0, 0.0],
+            power=[1.0, 1.0, 1.0],
+        )
+        assert cdl.slope == (1.0, 1.0, 1.0)
+        assert cdl.to_ocio_obj() == []
+        assert hash(cdl) == hash(OCIOCDLTransform(slope=(1.0, 1.0, 1.0)))
+        assert len(OCIOCDLTransform(slope=[1.2, 1.1, 1.0]).to_ocio_obj()) == 1
+
     @pytest.mark.parametrize(
         "data, expected_len",
         [
@@ -172,6 +231,47 @@ class TestColorOperators:
                 },
                 5
             ),
+            (
+                {
+                    "ocioLookItems": [
+                        {
+                            "file": "path/to/lut1.cube",
+                            "input_colorspace": {
+                                "colorspace": "ACES - ACEScg"
+                            },
+                            "output_colorspace": {
+                                "colorspace": "ACES - ACEScc"
+                            },
+                            "direction": "forward",
+                            "interpolation": "tetrahedral"
+                        },
+                        {
+                            "file": "path/to/lut2.cube",
+                            "input_colorspace": {
+                                "colorspace": "ACES - ACEScc"
+                            },
+                            "output_colorspace": {
+                                "colorspace": "ACES - ACEScg"
+                            },
+                            "direction": "forward",
+                            "interpolation": "tetrahedral"
+                        },
+                    ],
+                    "ocioLookWorkingSpace": {
+                        "colorspace": "ACES - ACEScg"
+                    },
+                },
+                2
+            ),
+            (
+                {
+                    "ocioLookItems": [],
+                    "ocioLookWorkingSpace": {
+                        "colorspace": "ACES - ACEScg"
+                    },
+                },
+                0
+            ),
         ],
     )
     def test_AYONOCIOLookProduct(self, data: dict, expected_len: int):
@@ -180,3 +280,8 @@ class TestColorOperators:
 
         log.debug(f"{cdl_obj = }")
         assert len(cdl_obj) == expected_len
+
+        # every call hands out fresh OCIO objects
+        new_obj = cdl.to_ocio_obj()
+        assert [str(xfm) for xfm in new_obj] == [str(xfm) for xfm in cdl_obj]
+        assert not any(a is b for a, b in zip(new_obj, cdl_obj))
@@ -5,7 +5,8 @@ from typing import List, Union
 
 import pytest
 
-from lablib.operators import Transform, Crop, Mirror2
+from lablib.operators import Transform, Crop, Mirror2, CornerPin2D
+from lablib.operators.repositions import get_oiio_args
 
 log = logging.getLogger(__name__)
 
@@ -49,10 +50,10 @@ class TestRepositionOperators:
         oiio_args = xfm.to_oiio_args()
 
         # assert fields
-        assert xfm.translate == [0.0, 0.0]
+        assert xfm.translate == (0.0, 0.0)
         assert xfm.rotate == 0.0
-        assert xfm.scale == [1.075, 1.075]
-        assert xfm.center == [2191.0, 1155.0]
+        assert xfm.scale == (1.075, 1.075)
+        assert xfm.center == (2191.0, 1155.0)
         assert xfm.skewX == 0.0
         assert xfm.skewY == 0.0
         assert not xfm.invert
@@ -63,6 +64,55 @@ class TestRepositionOperators:
             "1.075,0.0,0.0,0.0,1.075,0.0,-164.32499999999982,-86.625,1.0",
         ]
 
+    @pytest.mark.parametrize(
+        "data, expected",
+        [
+            ({"scale": 1.0}, []),
+            (
+                {"translate": [10.0, -20.0], "scale": 1.0},
+                ["--originoffset", "+10-20"],
+            ),
+            (
+                {"translate": [10.5, 0.0], "scale": 1.0},
+                [
+                    "--warp:filter=cubic:recompute_roi=1",
+                    "1.0,0.0,0.0,0.0,1.0,0.0,10.5,0.0,1.0",
+                ],
+            ),
+        ],
+    )
+    def test_Transform_shortcuts(self, data, expected):
+        xfm = Transform.from_node_data(data)
+        assert xfm.to_oiio_args() == expected
+
+    def test_get_oiio_args_composes_transforms(self):
+        ops = [
+            Transform(translate=[10.0, 0.0]),
+            Transform(scale=[2.0, 2.0]),
+            Mirror2(flop=True),
+            Transform(scale=[0.5, 0.5]),
+        ]
+        assert get_oiio_args(ops) == [
+            "--warp:filter=cubic:recompute_roi=1",
+            "2.0,0.0,0.0,0.0,2.0,0.0,20.0,0.0,1.0",
+            "--flop",
+            "--warp:filter=cubic:recompute_roi=1",
+            "0.5,0.0,0.0,0.0,0.5,0.0,0.0,0.0,1.0",
+        ]
+
+    def test_CornerPin2D(self):
+        corners = [[0.0, 0.0], [1920.0, 0.0], [1920.0, 1080.0], [0.0, 1080.0]]
+        # identity and default (collapsed) corners need no warp
+        assert CornerPin2D(*corners, *corners).to_oiio_args() == []
+        assert CornerPin2D().to_oiio_args() == []
+
+        shifted = [[x + 10.0, y + 20.0] for x, y in corners]
+        cornerpin = CornerPin2D(*corners, *shifted)
+        assert cornerpin.to_oiio_args() == [
+            "--warp:filter=cubic:recompute_roi=1",
+            "1.0,0.0,0.0,0.0,1.0,0.0,10.0,20.0,1.0",
+        ]
+
     @pytest.mark.parametrize(
         "crop_op_data",
         [
@@ -79,7 +129,7 @@ class TestRepositionOperators:
         oiio_args = crop.to_oiio_args()
 
         # assert fields
-        assert crop.box == [0.0, 0.0, 1920.0, 1080.0]
+        assert crop.box == (0.0, 0.0, 1920.0, 1080.0)
 
         # assert argument output
         assert oiio_args == ["--crop", "0.0,0.0,1920.0,1080.0"]
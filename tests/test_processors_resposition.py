@@ -21,6 +21,11 @@ class TestRepositionProcessor:
         cmd = proc.get_oiiotool_cmd()
         assert cmd == []
 
+    def test_OIIORepositionProcessor_ownOperators(self):
+        proc = OIIORepositionProcessor()
+        proc.operators.append(repositions.Mirror2(flop=True))
+        assert OIIORepositionProcessor().operators == []
+
     def test_OIIORepositionProcessor_withReformat(self):
         proc = OIIORepositionProcessor(
             dst_height=1080,